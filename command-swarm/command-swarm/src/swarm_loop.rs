@@ -57,11 +57,24 @@ where
     #[instrument(name = "swarm_loop", skip(self))]
     pub async fn run(mut self) -> Result<(), Box<dyn Error + Send + Sync>> {
         info!("Main loop started");
+        // Commands are drained in batches: one wakeup of the loop pulls every
+        // command already queued (up to COMMAND_BATCH_SIZE) instead of paying
+        // a full select round-trip per command during bursts.
+        const COMMAND_BATCH_SIZE: usize = 64;
+        let mut command_batch: Vec<C> = Vec::with_capacity(COMMAND_BATCH_SIZE);
+        let mut commands_open = true;
         loop {
             tokio::select! {
-                Some(cmd) = self.command_rx.recv() => {
-                    debug!("Received command from channel");
-                    self.handle_command(cmd).await;
+                received = self.command_rx.recv_many(&mut command_batch, COMMAND_BATCH_SIZE), if commands_open => {
+                    if received == 0 {
+                        // recv_many returns 0 only when the channel is closed
+                        commands_open = false;
+                    } else {
+                        debug!(batch_size = received, "Received command batch from channel");
+                        for cmd in command_batch.drain(..) {
+                            self.handle_command(cmd).await;
+                        }
+                    }
                 }
                 event = self.swarm.select_next_some() => {
                     debug!("Received event from Swarm");
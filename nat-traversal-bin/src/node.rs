@@ -1,6 +1,7 @@
 use base64::prelude::*;
 use clap::Parser;
 use libp2p::Multiaddr;
+use libp2p::multiaddr::Protocol;
 use std::env;
 use std::time::Duration;
 use tokio::time::sleep;
@@ -66,32 +67,22 @@ async fn main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     //node.commander.add_external_address(node_addr.clone()).await?;
     //println!("✅ Внешний адрес добавлен: {}", node_addr);
 
+    // Разбираем адрес relay сервера один раз и переиспользуем его ниже
+    // (подключение, relay адрес, AutoNAT, bootstrap)
+    let relay_server_addr = parse_relay_multiaddr(&args.relay_address)?;
+
     // Подключаемся к relay с повторными попытками
     println!("🔗 Подключаемся к relay серверу {}...", args.relay_address);
-    connect_to_relay_with_retries(&mut node, &args.relay_address).await?;
+    connect_to_relay_with_retries(&mut node, &relay_server_addr).await?;
     println!("✅ Подключение к relay установлено");
 
     sleep(Duration::from_millis(5000)).await;
     // Получаем relay адрес
     println!("🌐 Получаем relay адрес...");
     sleep(Duration::from_millis(500)).await;
-    let relay_addr = get_relay_address(&mut node, &args.relay_peer_id).await?;
+    let relay_addr = get_relay_address(&mut node, &relay_server_addr, &args.relay_peer_id).await?;
     println!("✅ Relay адрес получен: {}", relay_addr);
 
-    // Создаем адрес relay сервера для AutoNAT
-    let (host, port) = if args.relay_address.contains(':') {
-        let parts: Vec<&str> = args.relay_address.split(':').collect();
-        (parts[0], parts[1])
-    } else {
-        (args.relay_address.as_str(), "15003")
-    };
-
-    let relay_server_addr: Multiaddr = if host.contains('.') {
-        format!("/ip4/{}/udp/{}/quic-v1", host, port).parse()?
-    } else {
-        format!("/dns4/{}/udp/{}/quic-v1", host, port).parse()?
-    };
-
     // Добавляем relay как AutoNAT сервер
     println!("🌐 Добавляем relay как AutoNAT сервер...");
     let relay_peer_id: libp2p::PeerId = args.relay_peer_id.parse()?;
@@ -124,9 +115,10 @@ async fn main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
         println!("✅ Найдены адреса пира: {:?}", target_addrs);
 
         // Подключаемся через relay
+        // Ищем relay адрес по компоненту /p2p-circuit/, без стрингификации адресов
         if let Some(relay_addr_for_target) = target_addrs
             .iter()
-            .find(|addr| addr.to_string().contains("p2p-circuit"))
+            .find(|addr| addr.iter().any(|proto| matches!(proto, Protocol::P2pCircuit)))
         {
             println!(
                 "🔗 Подключаемся к пиру через relay: {}",
@@ -190,11 +182,12 @@ async fn main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     Ok(())
 }
 
-/// Подключается к relay с повторными попытками
-async fn connect_to_relay_with_retries(
-    node: &mut xnetwork2::node::Node,
+/// Разбирает адрес вида host:port в multiaddr relay сервера.
+/// Вызывается один раз при старте; результат переиспользуется всеми
+/// этапами вместо повторного разбора той же строки.
+fn parse_relay_multiaddr(
     relay_addr: &str,
-) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
+) -> Result<Multiaddr, Box<dyn std::error::Error + Send + Sync>> {
     // Разбираем адрес на хост и порт
     let (host, port) = if relay_addr.contains(':') {
         let parts: Vec<&str> = relay_addr.split(':').collect();
@@ -204,14 +197,20 @@ async fn connect_to_relay_with_retries(
     };
 
     // Создаем правильный multiaddr в зависимости от типа хоста
-    let relay_multiaddr: Multiaddr = if host.contains('.') {
+    if host.contains('.') {
         // IPv4 адрес
-        format!("/ip4/{}/udp/{}/quic-v1", host, port).parse()?
+        Ok(format!("/ip4/{}/udp/{}/quic-v1", host, port).parse()?)
     } else {
         // DNS имя
-        format!("/dns4/{}/udp/{}/quic-v1", host, port).parse()?
-    };
+        Ok(format!("/dns4/{}/udp/{}/quic-v1", host, port).parse()?)
+    }
+}
 
+/// Подключается к relay с повторными попытками
+async fn connect_to_relay_with_retries(
+    node: &mut xnetwork2::node::Node,
+    relay_multiaddr: &Multiaddr,
+) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     println!(
         "🔗 Пытаемся подключиться к relay по адресу: {}",
         relay_multiaddr
@@ -287,28 +286,9 @@ async fn connect_to_relay_with_retries(
 /// Получает relay адрес через настройку прослушивания на специальном relay адресе
 async fn get_relay_address(
     node: &mut xnetwork2::node::Node,
+    relay_addr: &Multiaddr,
     relay_peer_id: &str,
 ) -> Result<Multiaddr, Box<dyn std::error::Error + Send + Sync>> {
-    // Получаем адрес relay из аргументов командной строки
-    let args = Args::parse();
-
-    // Разбираем адрес на хост и порт
-    let (host, port) = if args.relay_address.contains(':') {
-        let parts: Vec<&str> = args.relay_address.split(':').collect();
-        (parts[0], parts[1])
-    } else {
-        (args.relay_address.as_str(), "15003")
-    };
-
-    // Создаем правильный multiaddr в зависимости от типа хоста
-    let relay_addr: Multiaddr = if host.contains('.') {
-        // IPv4 адрес
-        format!("/ip4/{}/udp/{}/quic-v1", host, port).parse()?
-    } else {
-        // DNS имя
-        format!("/dns4/{}/udp/{}/quic-v1", host, port).parse()?
-    };
-
     // Формируем relay адрес с правильным peer ID
     let relay_addr_str = format!(
         "{}/p2p/{}/p2p-circuit",
@@ -13,20 +13,71 @@ run_with_prefix() {
     local prefix="$1"
     shift
     # env передает локальные переменные (первые аргументы) только для этой команды
-    # sed -u (unbuffered) нужен, чтобы вывод появлялся немедленно
-    
-    # Перенаправляем вывод sed в stderr (>&2).
-    env "$@" 2>&1 | sed -u "s/^/[$prefix] /" >&2 &
-    
+    # stdbuf -oL (построчная буферизация) дает немедленный вывод строк,
+    # но без sed -u, который читает вход по одному байту на syscall
+
+    # tee пишет лог в файл для событийных ожиданий (wait_for_marker),
+    # sed перенаправляет префиксованный вывод в stderr (>&2).
+    env "$@" 2>&1 | stdbuf -oL tee "$LOG_DIR/$prefix.log" | stdbuf -oL sed "s/^/[$prefix] /" >&2 &
+
     echo $!  # PID последнего процесса в конвейере (sed)
 }
 
+# Каталог для лог-файлов запущенных процессов
+LOG_DIR=$(mktemp -d /tmp/relay_test_logs.XXXXXX)
+trap 'rm -rf "$LOG_DIR"' EXIT
+
+# -----------------------
+# Ожидание маркера в лог-файле вместо фиксированного sleep:
+# возвращается сразу, как только маркер появился.
+# Каждый опрос сканирует только последние 64 КиБ лога — окно поиска
+# ограничено, поэтому стоимость опроса не растет вместе с логом.
+# -----------------------
+wait_for_marker() {
+    local logfile="$1" marker="$2" timeout_s="$3"
+    local deadline=$((SECONDS + timeout_s))
+    while [ "$SECONDS" -lt "$deadline" ]; do
+        if [ -f "$logfile" ] && tail -c 65536 "$logfile" | grep -q -F "$marker"; then
+            return 0
+        fi
+        sleep 0.1
+    done
+    return 1
+}
+
+# -----------------------
+# Проверка актуальности сборки: true, если бинарники отсутствуют
+# или исходники/манифест новее любого из них
+# -----------------------
+needs_build() {
+    local bin newest_src
+    for bin in ./target/debug/relay ./target/debug/node; do
+        [ -f "$bin" ] || return 0
+    done
+    # Самый свежий исходник (включая Cargo.toml)
+    newest_src=$(find src Cargo.toml -name '*.rs' -o -name 'Cargo.toml' 2>/dev/null \
+        | xargs -r stat -c '%Y' | sort -n | tail -1)
+    [ -z "$newest_src" ] && return 0
+    for bin in ./target/debug/relay ./target/debug/node; do
+        if [ "$(stat -c '%Y' "$bin")" -lt "$newest_src" ]; then
+            return 0
+        fi
+    done
+    return 1
+}
+
 # -----------------------
 # ФАЗА 0: Сборка проекта
 # -----------------------
-echo "🔨 Собираем проект..."
-cargo build
-echo "✅ Проект успешно собран"
+# Пропускаем cargo build, если бинарники уже свежее исходников:
+# даже no-op сборка тратит время на запуск cargo и чтение манифестов
+if needs_build; then
+    echo "🔨 Собираем проект..."
+    cargo build
+    echo "✅ Проект успешно собран"
+else
+    echo "✅ Бинарники актуальны, пропускаем сборку"
+fi
 
 # Убедимся, что бинарные файлы существуют
 if [ ! -f "./target/debug/relay" ] || [ ! -f "./target/debug/node" ]; then
@@ -59,8 +110,11 @@ echo "🚀 ФАЗА 1: Запуск relay сервера..."
 # ИЗМЕНЕНИЕ: Запускаем бинарный файл напрямую, а не через 'cargo run'
 RELAY_PID=$(run_with_prefix "RELAY" NODE_KEY="$RELAY_KEY" ./target/debug/relay)
 
-echo "⏳ Ждем запуска relay сервера (5 секунд)..."
-sleep 5
+echo "⏳ Ждем готовности relay сервера (до 15 секунд)..."
+if ! wait_for_marker "$LOG_DIR/RELAY.log" "✅ Relay сервер готов к работе" 15; then
+    echo "❌ Relay сервер не сообщил о готовности"
+    exit 1
+fi
 
 # Проверка PID (sed) все еще работает. Если relay упадет, sed тоже завершится.
 if ps -p $RELAY_PID > /dev/null; then
@@ -79,8 +133,10 @@ echo "🔄 ФАЗА 2: Запуск node2 (пассивный узел)..."
 NODE2_PID=$(run_with_prefix "NODE2" NODE_KEY="$NODE2_KEY" ./target/debug/node \
     --relay-address 127.0.0.1:15003 --relay-peer-id "$RELAY_PEER_ID")
 
-echo "⏳ Ждем запуска node2 (3 секунды)..."
-sleep 3
+echo "⏳ Ждем подключения node2 к relay (до 30 секунд)..."
+if ! wait_for_marker "$LOG_DIR/NODE2.log" "✅ Подключение к relay установлено" 30; then
+    echo "⚠️ Node2 не сообщил о подключении к relay, продолжаем с проверкой процесса..."
+fi
 
 if ps -p $NODE2_PID > /dev/null; then
     echo "✅ Node2 запущен (PID: $NODE2_PID)"
@@ -109,14 +165,18 @@ if ! ps -p $NODE1_PID > /dev/null; then
     echo "❌ Node1 не запустился или завершился мгновенно."
     NODE1_STATUS="STOPPED"
 else
-    echo "⏳ Node1 запущен (PID: $NODE1_PID). Ждем 20 секунд, проверяя стабильность..."
-    sleep 45 # Общее время ожидания = 1 + 19 = 20 секунд
-    
+    echo "⏳ Node1 запущен (PID: $NODE1_PID). Ждем подключения через relay (до 45 секунд)..."
+    if wait_for_marker "$LOG_DIR/NODE1.log" "✅ Подключение к пиру установлено через relay" 45; then
+        echo "✅ Node1 подключился к Node2 через relay."
+    else
+        echo "⚠️ Node1 не сообщил о подключении через relay за 45 секунд."
+    fi
+
     if ps -p $NODE1_PID > /dev/null; then
         echo "✅ Node1 все еще работает."
         NODE1_STATUS="RUNNING"
     else
-        echo "❌ Node1 завершился (возможно, с ошибкой) в течение 20 секунд."
+        echo "❌ Node1 завершился (возможно, с ошибкой)."
         NODE1_STATUS="STOPPED"
     fi
 fi
@@ -143,15 +203,28 @@ fi
 echo ""
 echo "🧹 ФАЗА 5: Очистка ресурсов..."
 
-# ИЗМЕНЕНИЕ: Теперь мы ищем конкретные бинарные файлы, а не 'cargo run'
-echo "🛑 Принудительно завершаем все процессы 'target/debug/node'..."
-pkill -KILL -f "target/debug/node" 2>/dev/null || true
-
-echo "🛑 Принудительно завершаем все процессы 'target/debug/relay'..."
-pkill -KILL -f "target/debug/relay" 2>/dev/null || true
+# Эскалация вместо немедленного SIGKILL: сначала SIGTERM обоим паттернам
+# сразу, короткое ожидание с опросом, и только выжившим — SIGKILL.
+# Обычно процессы завершаются по SIGTERM за доли секунды, и фиксированная
+# пауза не нужна.
+echo "🛑 Завершаем все процессы 'target/debug/node' и 'target/debug/relay'..."
+pkill -TERM -f "target/debug/node" 2>/dev/null || true
+pkill -TERM -f "target/debug/relay" 2>/dev/null || true
+
+KILL_DEADLINE=$((SECONDS + 2))
+while [ "$SECONDS" -lt "$KILL_DEADLINE" ]; do
+    if ! pgrep -f "target/debug/node" > /dev/null \
+        && ! pgrep -f "target/debug/relay" > /dev/null; then
+        break
+    fi
+    sleep 0.1
+done
 
-# Даем 0.5с, чтобы ОС завершила процессы
-sleep 0.5
+if pgrep -f "target/debug/node" > /dev/null || pgrep -f "target/debug/relay" > /dev/null; then
+    echo "⚠️ Процессы не завершились по SIGTERM, отправляем SIGKILL..."
+    pkill -KILL -f "target/debug/node" 2>/dev/null || true
+    pkill -KILL -f "target/debug/relay" 2>/dev/null || true
+fi
 
 echo "✅ Очистка завершена."
 echo ""
@@ -19,64 +19,127 @@ fi
 
 echo "✅ .env файл готов"
 
+# Накапливаем логи в файле и дочитываем только новые строки через курсор --since,
+# вместо повторного получения всего лога целиком
+LOG_FILE=$(mktemp /tmp/nat_traversal_logs.XXXXXX)
+trap 'rm -f "$LOG_FILE"' EXIT
+LOG_CURSOR=""
+
+fetch_new_logs() {
+    # Фиксируем курсор ДО чтения: перекрытие строк допустимо, пропуск — нет
+    local next_cursor
+    next_cursor=$(date -u +%Y-%m-%dT%H:%M:%SZ)
+    if [ -n "$LOG_CURSOR" ]; then
+        docker compose logs --no-color --since "$LOG_CURSOR" >> "$LOG_FILE" 2>&1
+    else
+        docker compose logs --no-color >> "$LOG_FILE" 2>&1
+    fi
+    LOG_CURSOR="$next_cursor"
+}
+
 # Шаг 2: Запуск docker-compose
 echo "🐳 Запускаем docker-compose..."
 docker compose up -d
 
 echo "✅ Docker-compose запущен"
 
-# Шаг 3: Ожидание готовности
-echo "⏳ Ожидаем установку соединений (30 секунд)..."
-sleep 30
+# Ключевые сообщения, которые должны присутствовать в логах
+MARKERS=(
+    "✅ Подключение к пиру установлено через relay"
+    "✅ Node готов к работе"
+    "✅ Relay сервер готов к работе"
+    "✅ Kademlia DHT включена"
+    "✅ Подключение к relay установлено"
+)
+
+# Файл с паттернами для grep готовится один раз, а не пересобирается
+# через printf/подстановку процесса на каждой итерации опроса
+MARKERS_FILE=$(mktemp /tmp/nat_traversal_markers.XXXXXX)
+printf '%s\n' "${MARKERS[@]}" > "$MARKERS_FILE"
+trap 'rm -f "$LOG_FILE" "$MARKERS_FILE"' EXIT
+
+declare -A FOUND
+LAST_SCANNED_SIZE=0
+
+# Один проход grep по всем маркерам сразу вместо пяти отдельных сканов лога.
+# Размер файла служит дешевым детектором изменений: если с прошлого скана
+# ничего не дописано, скан пропускается целиком. Сканируются только новые
+# байты: однажды найденный маркер остается в FOUND, поэтому перечитывать
+# уже просмотренную часть лога не нужно.
+scan_log_for_markers() {
+    local size
+    size=$(stat -c %s "$LOG_FILE")
+    if [ "$size" -eq "$LAST_SCANNED_SIZE" ]; then
+        return
+    fi
+    while IFS= read -r marker; do
+        FOUND["$marker"]=1
+    done < <(tail -c +$((LAST_SCANNED_SIZE + 1)) "$LOG_FILE" \
+        | grep -o -F -f "$MARKERS_FILE" | sort -u)
+    LAST_SCANNED_SIZE="$size"
+}
+
+# Шаг 3: Ожидание готовности — опрашиваем логи и выходим сразу,
+# как только все маркеры найдены, вместо фиксированного sleep 30
+echo "⏳ Ожидаем установку соединений (до 30 секунд)..."
+ALL_FOUND=false
+WAIT_DEADLINE=$((SECONDS + 30))
+while [ "$SECONDS" -lt "$WAIT_DEADLINE" ]; do
+    fetch_new_logs
+    scan_log_for_markers
+    if [ "${#FOUND[@]}" -eq "${#MARKERS[@]}" ]; then
+        echo "✅ Все маркеры найдены за ${SECONDS} секунд"
+        ALL_FOUND=true
+        break
+    fi
+    sleep 1
+done
 
 # Шаг 4: Проверка логов
 echo "📋 Проверяем логи..."
 
-# Получаем логи всех контейнеров
-LOGS=$(docker compose logs --no-color 2>&1)
-
-# Проверяем ключевые сообщения
-SUCCESS=true
-
-echo "🔍 Проверяем node1..."
-if echo "$LOGS" | grep -q "✅ Подключение к пиру установлено через relay"; then
-    echo "✅ node1 успешно подключился к node2 через relay"
-else
-    echo "❌ node1 НЕ подключился к node2 через relay"
-    SUCCESS=false
-fi
-
-echo "🔍 Проверяем node2..."
-if echo "$LOGS" | grep -q "✅ Node готов к работе"; then
-    echo "✅ node2 успешно запущен и готов к работе"
-else
-    echo "❌ node2 НЕ запущен корректно"
-    SUCCESS=false
-fi
-
-echo "🔍 Проверяем relay..."
-if echo "$LOGS" | grep -q "✅ Relay сервер готов к работе"; then
-    echo "✅ relay успешно запущен"
-else
-    echo "❌ relay НЕ запущен корректно"
-    SUCCESS=false
-fi
-
-echo "🔍 Проверяем Kademlia DHT..."
-if echo "$LOGS" | grep -q "✅ Kademlia DHT включена"; then
-    echo "✅ Kademlia DHT работает на всех узлах"
-else
-    echo "❌ Kademlia DHT НЕ работает"
-    SUCCESS=false
+# Финальный дочит нужен только если опрос завершился по таймауту:
+# при полном наборе маркеров повторный fetch+скан ничего не добавит
+if [ "$ALL_FOUND" = false ]; then
+    fetch_new_logs
+    scan_log_for_markers
 fi
 
-echo "🔍 Проверяем подключения..."
-if echo "$LOGS" | grep -q "✅ Подключение к relay установлено"; then
-    echo "✅ Узлы успешно подключились к relay"
-else
-    echo "❌ Узлы НЕ подключились к relay"
-    SUCCESS=false
-fi
+# Описания проверок в том же порядке, что и MARKERS
+CHECK_LABELS=(
+    "node1"
+    "node2"
+    "relay"
+    "Kademlia DHT"
+    "подключения"
+)
+CHECK_OK=(
+    "✅ node1 успешно подключился к node2 через relay"
+    "✅ node2 успешно запущен и готов к работе"
+    "✅ relay успешно запущен"
+    "✅ Kademlia DHT работает на всех узлах"
+    "✅ Узлы успешно подключились к relay"
+)
+CHECK_FAIL=(
+    "❌ node1 НЕ подключился к node2 через relay"
+    "❌ node2 НЕ запущен корректно"
+    "❌ relay НЕ запущен корректно"
+    "❌ Kademlia DHT НЕ работает"
+    "❌ Узлы НЕ подключились к relay"
+)
+
+# Проверяем ключевые сообщения: отчет строится из набора FOUND,
+# без повторных сканов лога на каждую проверку
+SUCCESS=true
+for i in "${!MARKERS[@]}"; do
+    echo "🔍 Проверяем ${CHECK_LABELS[$i]}..."
+    if [ -n "${FOUND["${MARKERS[$i]}"]}" ]; then
+        echo "${CHECK_OK[$i]}"
+    else
+        echo "${CHECK_FAIL[$i]}"
+        SUCCESS=false
+    fi
+done
 
 # Шаг 5: Остановка и очистка
 echo "🧹 Останавливаем docker-compose..."
@@ -96,6 +159,12 @@ else
     echo "❌ NAT traversal не удался"
     echo ""
     echo "📋 Логи для анализа:"
-    echo "$LOGS" | tail -50
+    tail -50 "$LOG_FILE"
+    # Диагностика: фильтруем интересные строки прямо из файла,
+    # не загружая весь лог в переменную; один проход grep по всем
+    # категориям сразу вместо трех отдельных сканов
+    echo ""
+    echo "📋 Строки с ошибками / relay / error:"
+    grep -i -E "❌|relay|error" "$LOG_FILE" | tail -40
     exit 1
 fi
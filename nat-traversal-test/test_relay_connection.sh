@@ -13,14 +13,41 @@ fi
 
 echo "🔑 Ключи загружены из .env"
 
-# Запускаем relay сервер в фоне
+# Запускаем relay сервер в фоне, дублируя вывод в лог-файл
 echo "🚀 Запускаем relay сервер..."
-NODE_KEY=$RELAY_KEY cargo run --bin relay &
+RELAY_LOG=$(mktemp /tmp/relay_connection_test.XXXXXX)
+trap 'rm -f "$RELAY_LOG"' EXIT
+NODE_KEY=$RELAY_KEY cargo run --bin relay 2>&1 | tee "$RELAY_LOG" &
 RELAY_PID=$!
 
-# Ждем запуска relay
-echo "⏳ Ждем запуска relay сервера..."
-sleep 5
+# Ждем маркер готовности вместо фиксированного sleep 5.
+# Лог читается инкрементально: каждый опрос сканирует только байты,
+# дописанные после предыдущего, а не файл целиком.
+echo "⏳ Ждем запуска relay сервера (до 30 секунд)..."
+SCANNED_SIZE=0
+RELAY_READY=false
+WAIT_DEADLINE=$((SECONDS + 30))
+while [ "$SECONDS" -lt "$WAIT_DEADLINE" ]; do
+    SIZE=$(stat -c %s "$RELAY_LOG")
+    if [ "$SIZE" -gt "$SCANNED_SIZE" ]; then
+        if tail -c +$((SCANNED_SIZE + 1)) "$RELAY_LOG" | grep -q -F "✅ Relay сервер готов к работе"; then
+            RELAY_READY=true
+            break
+        fi
+        # Оставляем перекрытие в 200 байт, чтобы маркер, разрезанный
+        # границей двух дочитываний, не был пропущен
+        if [ "$SIZE" -gt 200 ]; then
+            SCANNED_SIZE=$((SIZE - 200))
+        fi
+    fi
+    sleep 0.2
+done
+
+if [ "$RELAY_READY" = false ]; then
+    echo "❌ Relay сервер не сообщил о готовности за 30 секунд"
+    kill $RELAY_PID 2>/dev/null
+    exit 1
+fi
 
 echo "✅ Relay сервер запущен (PID: $RELAY_PID)"
 
@@ -8,7 +8,7 @@ use libp2p::{PeerId, Stream};
 use std::sync::Arc;
 use tokio::sync::{Mutex, mpsc};
 use tokio::select;
-use tracing::{debug, error, info, warn};
+use tracing::{debug, error, warn};
 
 use super::types::{XStreamDirection, XStreamID, XStreamState};
 use super::xstream_state::XStreamStateManager;
@@ -52,7 +52,7 @@ impl XStream {
         direction: XStreamDirection,
         closure_notifier: mpsc::UnboundedSender<(PeerId, XStreamID)>,
     ) -> Self {
-        info!(
+        debug!(
             "Creating new XStream with id: {:?} for peer: {}, direction: {:?}",
             id, peer_id, direction
         );
@@ -420,6 +420,19 @@ impl XStream {
         }
     }
 
+    /// Reads all data from the main stream and decodes it as UTF-8
+    ///
+    /// Validates the buffer in place and converts it into a String without
+    /// an extra copy. Invalid UTF-8 is reported as an InvalidData IO error
+    /// with the raw bytes preserved as partial data.
+    pub async fn read_to_string(&self) -> XStreamReadResult<String> {
+        let data = self.read_to_end().await?;
+        String::from_utf8(data).map_err(|e| {
+            let io_error = std::io::Error::new(std::io::ErrorKind::InvalidData, e.utf8_error());
+            ErrorOnRead::from_io_error(e.into_bytes(), io_error)
+        })
+    }
+
     /// Simple read_to_end for inbound streams
     async fn read_to_end_simple(&self) -> XStreamReadResult<Vec<u8>> {
         let mut buf: Vec<u8> = Vec::new();
@@ -653,6 +666,24 @@ impl XStream {
         .await
     }
 
+    /// Writes several buffers to the main stream back-to-back
+    ///
+    /// Takes the write half once and writes every chunk under the same
+    /// guard, so a batch of messages pays one lock acquisition instead of
+    /// one per message.
+    pub async fn write_many(&self, bufs: Vec<Vec<u8>>) -> Result<(), std::io::Error> {
+        self.execute_main_write_op(|writer| {
+            let chunks = bufs.clone();
+            Box::pin(async move {
+                for chunk in &chunks {
+                    writer.write_all(chunk).await?;
+                }
+                Ok(())
+            })
+        })
+        .await
+    }
+
     /// Flushes the main stream
     pub async fn flush(&self) -> Result<(), std::io::Error> {
         self.execute_main_write_op(|writer| Box::pin(async move { writer.flush().await }))
@@ -809,7 +840,7 @@ impl XStream {
     /// Явное закрытие обеих половин гарантирует корректное завершение потока
     /// drop половин обязательно для транспортного уровня
     pub async fn close(&mut self) -> Result<(), std::io::Error> {
-        info!(
+        debug!(
             "Closing XStream with id: {:?} for peer: {}",
             self.id, self.peer_id
         );
@@ -103,16 +103,11 @@ async fn main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     // Запускаем ноду
     node.start().await.expect("❌ Не удалось запустить ноду");
 
-    // Даем ноде время на инициализацию
-    sleep(Duration::from_millis(500)).await;
-
-    // Теперь получаем PeerId после запуска
+    // Команда get_network_state сама по себе подтверждает готовность:
+    // ответ означает, что swarm-цикл запущен и обрабатывает команды
     let peer_id = node.commander.get_network_state().await?.peer_id;
     println!("✅ Нода запущена с PeerId: {}", peer_id);
 
-    // Даем ноде время на инициализацию
-    sleep(Duration::from_millis(500)).await;
-
     // Проверяем состояние задачи после запуска
     println!(
         "📊 Состояние задачи после запуска: {}",
@@ -180,10 +175,6 @@ async fn main() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     println!("📊 Финальное состояние задачи: {}", node.get_task_status());
     println!("🔄 Задача работает: {}", node.is_running());
 
-    // Даем немного времени для завершения обработки событий
-    println!("⏳ Ожидаем завершения обработки событий...");
-    sleep(Duration::from_millis(500)).await;
-
     // Отменяем задачи обработки событий (они должны завершиться сами при закрытии канала)
     println!("🛑 Отменяем задачи обработки событий...");
     events_task1.abort();
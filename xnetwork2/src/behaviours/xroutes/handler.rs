@@ -5,8 +5,9 @@ use async_trait::async_trait;
 use command_swarm::{BehaviourHandler, ConnectionId};
 use libp2p::identity::PublicKey;
 use libp2p::{identify, mdns, kad, identity, PeerId, Multiaddr};
+use libp2p::multiaddr::Protocol;
 use std::collections::HashMap;
-use std::time::{SystemTime, Duration};
+use std::time::{Duration, Instant, SystemTime};
 use tokio::sync::oneshot;
 use tracing::{debug, info};
 
@@ -21,8 +22,8 @@ use crate::conntracker::{ConnectionInfo, PeerConnections, ConnectionStats};
 struct MdnsPeerRecord {
     /// Peer addresses
     addresses: Vec<Multiaddr>,
-    /// When this record was last updated
-    last_updated: SystemTime,
+    /// When this record was last updated (monotonic, immune to clock jumps)
+    last_updated: Instant,
     /// TTL in seconds
     ttl_seconds: u64,
 }
@@ -32,23 +33,20 @@ impl MdnsPeerRecord {
     fn new(addresses: Vec<Multiaddr>, ttl_seconds: u64) -> Self {
         Self {
             addresses,
-            last_updated: SystemTime::now(),
+            last_updated: Instant::now(),
             ttl_seconds,
         }
     }
 
     /// Check if the record has expired
     fn is_expired(&self) -> bool {
-        match SystemTime::now().duration_since(self.last_updated) {
-            Ok(elapsed) => elapsed.as_secs() >= self.ttl_seconds,
-            Err(_) => true, // If time went backwards, consider expired
-        }
+        self.last_updated.elapsed().as_secs() >= self.ttl_seconds
     }
 
     /// Update the record with new addresses
     fn update(&mut self, addresses: Vec<Multiaddr>) {
         self.addresses = addresses;
-        self.last_updated = SystemTime::now();
+        self.last_updated = Instant::now();
     }
 }
 
@@ -189,7 +187,7 @@ impl XRoutesHandler {
     async fn handle_kad_event(&mut self, kad_event: kad::Event) {
         match kad_event {
             kad::Event::OutboundQueryProgressed { id, result, .. } => {
-                println!(
+                debug!(
                     "🔍 [XRoutesHandler] Kademlia query progressed - ID: {:?}, Result: {:?}",
                     id, result
                 );
@@ -213,15 +211,15 @@ impl XRoutesHandler {
                         // Сначала проверяем задачи FindPeerAddresses с таймаутом
                         if let Some(target_peer_id) = self.kad_state.find_addresses_tasks.get_task_extra(&id) {
                             // Для FindPeerAddresses, извлекаем адреса из peers и фильтруем только для целевого peer_id
-                            let target_peer_id_str = target_peer_id.to_string();
                             let addresses: Vec<Multiaddr> = peers.peers.iter()
                                 .flat_map(|peer_info| {
                                     // Извлекаем адреса из PeerInfo
                                     peer_info.addrs.clone()
                                 })
                                 .filter(|addr| {
-                                    // Фильтруем только адреса, которые содержат целевой peer ID
-                                    addr.to_string().contains(&target_peer_id_str)
+                                    // Фильтруем только адреса с компонентом /p2p/ целевого peer ID
+                                    // (сравниваем компоненты Multiaddr напрямую, без аллокации строк)
+                                    addr.iter().any(|proto| matches!(proto, Protocol::P2p(id) if id == target_peer_id))
                                 })
                                 .collect();
                             
@@ -240,15 +238,15 @@ impl XRoutesHandler {
                         else if let Some((target_peer_id, response)) = self.kad_state.pending_find_peer.remove(&id) {
                             // For FindPeer, we need to extract addresses from the peers
                             // and filter only addresses that belong to the target peer
-                            let target_peer_id_str = target_peer_id.to_string();
                             let addresses: Vec<Multiaddr> = peers.peers.iter()
                                 .flat_map(|peer_info| {
                                     // Extract addresses from PeerInfo
                                     peer_info.addrs.clone()
                                 })
                                 .filter(|addr| {
-                                    // Filter only addresses that contain the target peer ID
-                                    addr.to_string().contains(&target_peer_id_str)
+                                    // Match the /p2p/ component directly instead of
+                                    // allocating strings for every address
+                                    addr.iter().any(|proto| matches!(proto, Protocol::P2p(id) if id == target_peer_id))
                                 })
                                 .collect();
                             
@@ -369,44 +367,46 @@ impl BehaviourHandler for XRoutesHandler {
                 debug!("📊 [XRoutesHandler] Status sent");
             }
             XRoutesCommand::BootstrapToPeer { peer_id, addresses, response } => {
-                println!("🔄 [XRoutesHandler] Bootstrap to peer: {:?}", peer_id);
+                debug!("🔄 [XRoutesHandler] Bootstrap to peer: {:?}", peer_id);
                 if let Some(kad) = behaviour.kad.as_mut() {
                     // Add addresses to Kademlia
                     for addr in &addresses {
-                        println!("ADDR KAD {:?} {:?}", peer_id, addr);
+                        debug!("ADDR KAD {:?} {:?}", peer_id, addr);
                         kad.add_address(&peer_id, addr.clone());
                     }
-                    
 
-                     let kbuckets_info = kad.kbuckets();
-                    // kbuckets_info — это impl Iterator<Item = KBucketRef<'_, KBucketKey<PeerId>, Addresses>>
-                    for (i, bucket) in kbuckets_info.enumerate() {
-                        println!("Bucket {}:", i);
-                        for entry in bucket.iter() {
-                            // entry имеет тип NodeRefView<'_, KBucketKey<PeerId>, Addresses>
-                            let peer_id: &PeerId = &entry.node.key.preimage(); // доступ к PeerId
-                            let addresses: &Addresses = &entry.node.value;   // доступ к адресам
-                            println!("  PeerId: {:?}", peer_id);
-                            println!("  Addresses: {:?}", addresses);
+                    // Дамп k-buckets стоит O(размер таблицы) на каждый bootstrap,
+                    // поэтому обходим таблицу только когда debug-лог включен
+                    if tracing::enabled!(tracing::Level::DEBUG) {
+                        let kbuckets_info = kad.kbuckets();
+                        // kbuckets_info — это impl Iterator<Item = KBucketRef<'_, KBucketKey<PeerId>, Addresses>>
+                        for (i, bucket) in kbuckets_info.enumerate() {
+                            debug!("Bucket {}:", i);
+                            for entry in bucket.iter() {
+                                // entry имеет тип NodeRefView<'_, KBucketKey<PeerId>, Addresses>
+                                let peer_id: &PeerId = &entry.node.key.preimage(); // доступ к PeerId
+                                let addresses: &Addresses = &entry.node.value;   // доступ к адресам
+                                debug!("  PeerId: {:?}", peer_id);
+                                debug!("  Addresses: {:?}", addresses);
+                            }
                         }
                     }
-                    
-                    
+
                     // Start bootstrap
                     match kad.bootstrap() {
                         Ok(query_id) => {
                             self.kad_state.pending_bootstrap.insert(query_id, response);
-                            println!("✅ [XRoutesHandler] Bootstrap started for peer: {:?}", peer_id);
+                            info!("✅ [XRoutesHandler] Bootstrap started for peer: {:?}", peer_id);
                         }
                         Err(e) => {
                             let error_msg = format!("{:?}", e);
                             let _ = response.send(Err(e.into()));
-                            println!("❌ [XRoutesHandler] Bootstrap failed to start: {}", error_msg);
+                            debug!("❌ [XRoutesHandler] Bootstrap failed to start: {}", error_msg);
                         }
                     }
                 } else {
                     let _ = response.send(Err("Kademlia behaviour not enabled".into()));
-                    println!("❌ [XRoutesHandler] Cannot bootstrap: Kademlia not enabled");
+                    debug!("❌ [XRoutesHandler] Cannot bootstrap: Kademlia not enabled");
                 }
             }
             XRoutesCommand::FindPeer { peer_id, response } => {
@@ -629,7 +629,7 @@ impl BehaviourHandler for XRoutesHandler {
                         );
                     }
                     identify::Event::Error { peer_id, error, .. } => {
-                        println!(
+                        debug!(
                             "❌ [XRoutesHandler] Identify error with peer {:?}: {}",
                             peer_id, error
                         );
@@ -658,7 +658,7 @@ impl BehaviourHandler for XRoutesHandler {
                 // TODO: Add relay client event handling
             }
             XRoutesBehaviourEvent::Dcutr(dcutr_event) => {
-                println!("🔄 [XRoutesHandler] DCUtR event received: {:?}", dcutr_event);
+                debug!("🔄 [XRoutesHandler] DCUtR event received: {:?}", dcutr_event);
                 // DCUtR events are handled automatically by the behaviour
             }
             XRoutesBehaviourEvent::AutonatClient(autonat_client_event) => {
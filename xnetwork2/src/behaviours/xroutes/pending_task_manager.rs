@@ -186,6 +186,43 @@ where
             .collect()
     }
 
+    /// Завершает первую задачу, ключ которой удовлетворяет предикату,
+    /// и отменяет ее таймаут
+    ///
+    /// В отличие от пары get_pending_keys + set_task_result, выполняется
+    /// за одну блокировку и без клонирования всего списка ключей
+    ///
+    /// # Аргументы
+    /// - `predicate`: условие на ключ задачи
+    /// - `result`: успешный результат для отправки
+    ///
+    /// # Возвращает
+    /// - `Ok(true)`: если подходящая задача найдена и результат установлен
+    /// - `Ok(false)`: если подходящей задачи нет
+    /// - `Err`: если произошла ошибка отправки
+    pub fn set_first_matching_task_result(
+        &self,
+        predicate: impl Fn(&T) -> bool,
+        result: O,
+    ) -> Result<bool, PendingTaskError> {
+        let mut tasks = self.tasks.lock().unwrap();
+
+        let key = tasks.keys().find(|key| predicate(key)).cloned();
+        if let Some(key) = key {
+            let pending_task = tasks.remove(&key).expect("key was just found in the map");
+            // Отменяем таймаут
+            pending_task.handler.abort();
+
+            // Отправляем успешный результат
+            match pending_task.result_tx.send(Ok(result)) {
+                Ok(()) => Ok(true),
+                Err(_) => Err(PendingTaskError::TaskAlreadyCompleted),
+            }
+        } else {
+            Ok(false)
+        }
+    }
+
     /// Добавляет задачу с таймаутом и дополнительными данными
     /// 
     /// # Аргументы
@@ -2,7 +2,7 @@
 
 use async_trait::async_trait;
 use command_swarm::BehaviourHandler;
-use tracing::{debug, info};
+use tracing::debug;
 use xstream::behaviour::XStreamNetworkBehaviour;
 
 use super::command::XStreamCommand;
@@ -34,7 +34,7 @@ impl BehaviourHandler for XStreamHandler {
     async fn handle_event(&mut self, _behaviour: &mut Self::Behaviour, event: &Self::Event) {
         match event {
             xstream::events::XStreamEvent::StreamEstablished { peer_id, stream_id } => {
-                info!(
+                debug!(
                     " [XStreamHandler] Stream established - Peer: {:?}, Stream ID: {:?}",
                     peer_id, stream_id
                 );
@@ -100,6 +100,9 @@ pub struct ConnectionStats {
 /// ConnectionTracker behaviour for tracking all peer connections and addresses
 pub struct ConnectionTracker {
     peer_connections: HashMap<PeerId, PeerConnections>,
+    /// Index from ConnectionId to the owning PeerId so connection lookups
+    /// don't have to scan every peer's connection map
+    connection_index: HashMap<ConnectionId, PeerId>,
     listen_addresses: Vec<Multiaddr>,
     external_addresses: Vec<Multiaddr>,
     local_peer_id: PeerId,
@@ -110,6 +113,7 @@ impl ConnectionTracker {
     pub fn new(local_peer_id: PeerId) -> Self {
         Self {
             peer_connections: HashMap::new(),
+            connection_index: HashMap::new(),
             listen_addresses: Vec::new(),
             external_addresses: Vec::new(),
             local_peer_id,
@@ -123,12 +127,10 @@ impl ConnectionTracker {
 
     /// Get information about a specific connection
     pub fn get_connection(&self, connection_id: &ConnectionId) -> Option<&ConnectionInfo> {
-        for peer_conn in self.peer_connections.values() {
-            if let Some(conn_info) = peer_conn.connections.get(connection_id) {
-                return Some(conn_info);
-            }
-        }
-        None
+        let peer_id = self.connection_index.get(connection_id)?;
+        self.peer_connections
+            .get(peer_id)
+            .and_then(|peer_conn| peer_conn.connections.get(connection_id))
     }
 
     /// Get all connected peers (peers with at least one active connection)
@@ -198,6 +200,7 @@ impl ConnectionTracker {
 
         // Add the connection
         peer_connections.add_connection(connection_info);
+        self.connection_index.insert(event.connection_id, event.peer_id);
 
         // Add addresses from the connection endpoint
         match &event.endpoint {
@@ -212,6 +215,7 @@ impl ConnectionTracker {
 
     /// Handle ConnectionClosed event
     pub fn handle_connection_closed(&mut self, event: &ConnectionClosed) {
+        self.connection_index.remove(&event.connection_id);
         if let Some(peer_connections) = self.peer_connections.get_mut(&event.peer_id) {
             if let Some(mut connection_info) = peer_connections.remove_connection(&event.connection_id) {
                 // Update status to closed
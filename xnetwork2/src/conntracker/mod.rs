@@ -116,6 +116,11 @@ impl Conntracker {
         }
     }
 
+    /// Set the local peer ID in place, keeping all tracked state
+    pub fn set_local_peer_id(&mut self, local_peer_id: PeerId) {
+        self.local_peer_id = local_peer_id;
+    }
+
     /// Get PeerConnections for a specific peer
     pub fn get_peer_connections(&self, peer_id: &PeerId) -> Option<&PeerConnections> {
         self.peer_connections.get(peer_id)
@@ -77,7 +77,10 @@ impl Node {
         println!("🛑 Force shutting down XNetwork2 node...");
         self.stopper.stop();
         println!("✅ Force shutdown command sent, waiting for task completion...");
-        self.wait_for_shutdown().await?;
+        // Ограничиваем ожидание: если swarm loop завис, принудительное
+        // завершение не должно блокироваться бесконечно
+        self.wait_for_shutdown_with_timeout(std::time::Duration::from_secs(5))
+            .await?;
         println!("✅ XNetwork2 node force shutdown completed");
         Ok(())
     }
@@ -104,6 +107,36 @@ impl Node {
         }
     }
 
+    /// Wait for the swarm loop task to complete, but no longer than `timeout`.
+    /// On expiry the task is aborted so shutdown never hangs indefinitely.
+    pub async fn wait_for_shutdown_with_timeout(
+        &mut self,
+        timeout: std::time::Duration,
+    ) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
+        if let Some(handle) = self.swarm_loop_handle.take() {
+            println!("⏳ Waiting for swarm loop task to complete (up to {:?})...", timeout);
+            let abort_handle = handle.abort_handle();
+            match tokio::time::timeout(timeout, handle).await {
+                Ok(Ok(result)) => {
+                    println!("✅ Swarm loop task completed successfully");
+                    result
+                }
+                Ok(Err(e)) => {
+                    println!("❌ Swarm loop task failed: {}", e);
+                    Err(Box::new(e) as Box<dyn std::error::Error + Send + Sync>)
+                }
+                Err(_) => {
+                    println!("⚠️ Swarm loop task did not finish in {:?}, aborting it", timeout);
+                    abort_handle.abort();
+                    Err(format!("❌ Swarm loop task did not finish within {:?}", timeout).into())
+                }
+            }
+        } else {
+            println!("⚠️ No swarm loop task to wait for");
+            Ok(())
+        }
+    }
+
     /// Check if the swarm loop task is still running
     pub fn is_running(&self) -> bool {
         if let Some(handle) = &self.swarm_loop_handle {
@@ -47,7 +47,10 @@ impl Default for NodeConfig {
     fn default() -> Self {
         Self {
             inbound_decision_policy: InboundDecisionPolicy::default(),
-            event_buffer_size: 100,
+            // Буфер на 100 событий переполнялся при всплесках (bootstrap,
+            // mDNS discovery): отставшие подписчики получали Lagged и
+            // теряли события, что приводило к повторным ожиданиям
+            event_buffer_size: 1024,
             enable_relay_server: false,
             enable_dcutr: false,
             enable_autonat_server: false,
@@ -53,7 +53,7 @@ pub enum NodeEvent {
     /// PoR verification requested
     VerifyPorRequest {
         peer_id: PeerId,
-        connection_id: String,
+        connection_id: ConnectionId,
         por: Vec<u8>,
         metadata: std::collections::HashMap<String, String>,
     },
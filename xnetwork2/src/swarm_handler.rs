@@ -43,6 +43,8 @@ pub struct XNetworkSwarmHandler {
     >,
     /// Connection tracker service
     conntracker: Conntracker,
+    /// Monotonic counter for DialWaitKey attempt ids
+    next_dial_attempt_id: u64,
 }
 
 impl Default for XNetworkSwarmHandler {
@@ -53,6 +55,7 @@ impl Default for XNetworkSwarmHandler {
             listen_wait_tasks: PendingTaskManager::new(),
             dial_wait_tasks: PendingTaskManager::new(),
             conntracker: Conntracker::new(PeerId::random()), // Will be updated with actual peer_id later
+            next_dial_attempt_id: 0,
         }
     }
 }
@@ -66,13 +69,15 @@ impl XNetworkSwarmHandler {
             listen_wait_tasks: PendingTaskManager::new(),
             dial_wait_tasks: PendingTaskManager::new(),
             conntracker: Conntracker::new(PeerId::random()), // Will be updated with actual peer_id later
+            next_dial_attempt_id: 0,
         }
     }
 
     /// Update Conntracker with actual local peer ID from swarm
     pub fn update_local_peer_id(&mut self, local_peer_id: PeerId) {
-        // Create new Conntracker with correct local peer ID
-        self.conntracker = Conntracker::new(local_peer_id);
+        // Обновляем peer ID на месте: пересоздание трекера выбрасывало бы
+        // уже накопленные соединения и адреса
+        self.conntracker.set_local_peer_id(local_peer_id);
     }
 
     /// Check if a peer is authenticated
@@ -83,7 +88,7 @@ impl XNetworkSwarmHandler {
     /// Add a peer to authenticated set
     fn mark_peer_authenticated(&mut self, peer_id: PeerId) {
         self.authenticated_peers.insert(peer_id);
-        println!("✅ [SwarmHandler] Peer {} marked as authenticated", peer_id);
+        debug!("✅ [SwarmHandler] Peer {} marked as authenticated", peer_id);
     }
 
     /// Transform SwarmEvent into NodeEvent and emit through broadcast channel
@@ -93,14 +98,9 @@ impl XNetworkSwarmHandler {
             <XNetworkBehaviour as libp2p::swarm::NetworkBehaviour>::ToSwarm,
         >,
     ) {
-        // If event sender is not set, do nothing
-        let event_sender = match self.event_sender.as_ref() {
-            Some(sender) => sender,
-            None => return,
-        };
-
+        // Завершаем pending listen_and_wait / dial_and_wait задачи всегда,
+        // независимо от наличия подписчиков на события
         match event {
-            // Network events
             libp2p::swarm::SwarmEvent::NewListenAddr {
                 listener_id,
                 address,
@@ -117,7 +117,55 @@ impl XNetworkSwarmHandler {
                         listener_id
                     );
                 }
+            }
+            libp2p::swarm::SwarmEvent::ConnectionEstablished {
+                peer_id,
+                connection_id,
+                ..
+            } => {
+                // Try to complete pending dial_and_wait task if exists
+                // We complete the first matching task for this peer in one pass
+                // In practice, we should track which specific dial attempt corresponds to which connection
+                match self
+                    .dial_wait_tasks
+                    .set_first_matching_task_result(|key| key.peer_id == *peer_id, *connection_id)
+                {
+                    Ok(true) => {
+                        debug!(
+                            "✅ [SwarmHandler] Completed dial_and_wait task for peer: {} with connection_id: {:?}",
+                            peer_id, connection_id
+                        );
+                    }
+                    _ => {
+                        debug!(
+                            "📡 [SwarmHandler] Connection established for peer: {} with connection_id: {:?}, but no matching dial_and_wait task found",
+                            peer_id, connection_id
+                        );
+                    }
+                }
+            }
+            _ => {}
+        }
 
+        // If event sender is not set, do nothing
+        let event_sender = match self.event_sender.as_ref() {
+            Some(sender) => sender,
+            None => return,
+        };
+
+        // Дешевый префильтр: без подписчиков незачем трансформировать событие,
+        // send все равно вернул бы ошибку для каждого варианта
+        if event_sender.receiver_count() == 0 {
+            return;
+        }
+
+        match event {
+            // Network events
+            libp2p::swarm::SwarmEvent::NewListenAddr {
+                listener_id,
+                address,
+                ..
+            } => {
                 let _ = event_sender.send(NodeEvent::NewListenAddr {
                     listener_id: listener_id.clone(),
                     address: address.clone(),
@@ -139,38 +187,7 @@ impl XNetworkSwarmHandler {
                 endpoint,
                 ..
             } => {
-                println!("Conn established {:?}", peer_id);
-
-                // Try to complete pending dial_and_wait task if exists
-                // We need to find any DialWaitKey that matches this peer_id
-                // This is a simplified approach - we complete the first matching task for this peer
-                // In practice, we should track which specific dial attempt corresponds to which connection
-
-                // Try to find and complete any pending task for this peer
-                let mut completed = false;
-                for key in self.dial_wait_tasks.get_pending_keys() {
-                    if key.peer_id == *peer_id {
-                        if self
-                            .dial_wait_tasks
-                            .set_task_result(&key, *connection_id)
-                            .is_ok()
-                        {
-                            debug!(
-                                "✅ [SwarmHandler] Completed dial_and_wait task for peer: {} with connection_id: {:?}",
-                                peer_id, connection_id
-                            );
-                            completed = true;
-                            break;
-                        }
-                    }
-                }
-
-                if !completed {
-                    debug!(
-                        "📡 [SwarmHandler] Connection established for peer: {} with connection_id: {:?}, but no matching dial_and_wait task found",
-                        peer_id, connection_id
-                    );
-                }
+                debug!("Conn established {:?}", peer_id);
 
                 // Start authentication for this connection
                 // Note: We can't call commander directly from here, but we can emit an event
@@ -210,7 +227,7 @@ impl XNetworkSwarmHandler {
                             } => {
                                 let _ = event_sender.send(NodeEvent::VerifyPorRequest {
                                     peer_id: *peer_id,
-                                    connection_id: format!("{:?}", connection_id),
+                                    connection_id: *connection_id,
                                     por: por.peer_id.to_bytes(),
                                     metadata: metadata.clone(),
                                 });
@@ -509,11 +526,10 @@ impl SwarmHandler<XNetworkBehaviour> for XNetworkSwarmHandler {
                     peer_id, addr, timeout
                 );
 
-                // Generate a simple attempt_id based on current time
-                let attempt_id = std::time::SystemTime::now()
-                    .duration_since(std::time::UNIX_EPOCH)
-                    .unwrap_or_default()
-                    .as_nanos() as u64;
+                // Монотонный счетчик вместо SystemTime: без syscall-а на каждый
+                // dial и без коллизий при двух попытках в один и тот же наносек
+                let attempt_id = self.next_dial_attempt_id;
+                self.next_dial_attempt_id = self.next_dial_attempt_id.wrapping_add(1);
 
                 let key = DialWaitKey {
                     peer_id,
@@ -787,19 +803,19 @@ impl SwarmHandler<XNetworkBehaviour> for XNetworkSwarmHandler {
                                     info,
                                     connection_id,
                                 } => {
-                                    println!("Indetify pushed to peer {:?}", peer_id);
+                                    debug!("Indetify pushed to peer {:?}", peer_id);
                                 }
                                 _ => {}
                             },
                             super::behaviours::xroutes::XRoutesBehaviourEvent::RelayServer(
                                 relay_event,
                             ) => {
-                                println!(">>> RELAY SERVER event {:?}", relay_event);
+                                debug!(">>> RELAY SERVER event {:?}", relay_event);
                             }
                             super::behaviours::xroutes::XRoutesBehaviourEvent::RelayClient(
                                 relay_event,
                             ) => {
-                                println!(">>> RELAY CLIENT event {:?}", relay_event);
+                                debug!(">>> RELAY CLIENT event {:?}", relay_event);
                             }
                             super::behaviours::xroutes::XRoutesBehaviourEvent::Dcutr(
                                 dcutr_event,
@@ -86,7 +86,7 @@ async fn test_add_multiple_external_addresses() -> Result<(), Box<dyn std::error
     for addr in &addresses {
         node.commander.add_external_address(addr.clone())
             .await
-            .expect(&format!("❌ Не удалось добавить внешний адрес: {}", addr));
+            .unwrap_or_else(|_| panic!("❌ Не удалось добавить внешний адрес: {}", addr));
         println!("✅ Добавлен внешний адрес: {}", addr);
     }
 
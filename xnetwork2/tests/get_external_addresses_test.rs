@@ -3,6 +3,8 @@
 use libp2p::Multiaddr;
 use xnetwork2::NodeBuilder;
 
+mod utils;
+
 /// Тест получения всех внешних адресов через commander
 #[tokio::test]
 async fn test_get_external_addresses() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
@@ -106,7 +108,7 @@ async fn test_get_external_addresses_with_listening() -> Result<(), Box<dyn std:
     // Настраиваем прослушивание
     println!("🎯 Настраиваем прослушивание...");
     let listen_addr = node.commander.listen_and_wait(
-        "/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap(),
+        utils::TEST_LISTEN_ADDR.clone(),
         std::time::Duration::from_secs(5)
     ).await
     .expect("❌ Не удалось настроить прослушивание");
@@ -22,8 +22,9 @@ async fn test_kad_server_mode() {
     // Запускаем узел
     let _handle = node.start().await.expect("Failed to start node");
     
-    // Даем узлу время на инициализацию
-    tokio::time::sleep(Duration::from_secs(1)).await;
+    // Активная проверка готовности вместо фиксированной паузы:
+    // ответ на команду подтверждает, что swarm-цикл запущен и обрабатывает команды
+    node.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
     
     // Останавливаем узел
     node.stop().await.expect("Failed to stop node");
@@ -49,8 +50,9 @@ async fn test_kad_client_mode() {
     // Запускаем узел
     let _handle = node.start().await.expect("Failed to start node");
     
-    // Даем узлу время на инициализацию
-    tokio::time::sleep(Duration::from_secs(1)).await;
+    // Активная проверка готовности вместо фиксированной паузы:
+    // ответ на команду подтверждает, что swarm-цикл запущен и обрабатывает команды
+    node.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
     
     // Останавливаем узел
     node.stop().await.expect("Failed to stop node");
@@ -76,8 +78,9 @@ async fn test_kad_legacy_mode() {
     // Запускаем узел
     let _handle = node.start().await.expect("Failed to start node");
     
-    // Даем узлу время на инициализацию
-    tokio::time::sleep(Duration::from_secs(1)).await;
+    // Активная проверка готовности вместо фиксированной паузы:
+    // ответ на команду подтверждает, что swarm-цикл запущен и обрабатывает команды
+    node.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
     
     // Останавливаем узел
     node.stop().await.expect("Failed to stop node");
@@ -103,7 +106,7 @@ async fn test_kad_mode_priority() {
     
     // Запускаем и останавливаем узел
     let _handle1 = node1.start().await.expect("Failed to start node");
-    tokio::time::sleep(Duration::from_secs(1)).await;
+    node1.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
     node1.stop().await.expect("Failed to stop node");
     
     // Тест 2: Клиентский режим должен работать, когда серверный не указан
@@ -118,7 +121,7 @@ async fn test_kad_mode_priority() {
     
     // Запускаем и останавливаем узел
     let _handle2 = node2.start().await.expect("Failed to start node");
-    tokio::time::sleep(Duration::from_secs(1)).await;
+    node2.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
     node2.stop().await.expect("Failed to stop node");
     
     println!("✅ Kademlia mode priorities test passed");
@@ -138,7 +141,7 @@ async fn test_kad_modes_with_timeout() {
             .expect("Failed to create node with Kademlia server mode");
         
         let _handle = node.start().await.expect("Failed to start node");
-        tokio::time::sleep(Duration::from_secs(2)).await;
+        node.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
         node.stop().await.expect("Failed to stop node");
     }).await;
     
@@ -153,7 +156,7 @@ async fn test_kad_modes_with_timeout() {
             .expect("Failed to create node with Kademlia client mode");
         
         let _handle = node.start().await.expect("Failed to start node");
-        tokio::time::sleep(Duration::from_secs(2)).await;
+        node.commander.get_kad_mode().await.expect("Failed to query Kademlia mode");
         node.stop().await.expect("Failed to stop node");
     }).await;
     
@@ -34,7 +34,7 @@ async fn test_listen_and_wait_in_5_seconds() {
 
         // 4. ВЫПОЛНЕНИЕ LISTEN_AND_WAIT
         println!("🎯 Выполняем listen_and_wait...");
-        let listen_addr = node.commander.listen_and_wait("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap(), Duration::from_secs(3)).await
+        let listen_addr = node.commander.listen_and_wait(utils::TEST_LISTEN_ADDR.clone(), Duration::from_secs(3)).await
             .expect("❌ Не удалось выполнить listen_and_wait - критическая ошибка");
 
         println!("✅ listen_and_wait выполнен успешно, адрес: {}", listen_addr);
@@ -144,7 +144,7 @@ async fn test_dial_and_wait_in_5_seconds() {
 
         // 4. НОДА1 НАЧИНАЕТ СЛУШАТЬ ЧЕРЕЗ LISTEN_AND_WAIT
         println!("🎯 Нода1 начинает прослушивание через listen_and_wait...");
-        let listen_addr = node1.commander.listen_and_wait("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap(), Duration::from_secs(3)).await
+        let listen_addr = node1.commander.listen_and_wait(utils::TEST_LISTEN_ADDR.clone(), Duration::from_secs(3)).await
             .expect("❌ Не удалось выполнить listen_and_wait - критическая ошибка");
 
         println!("✅ Нода1 слушает на адресе: {}", listen_addr);
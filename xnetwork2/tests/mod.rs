@@ -1,4 +1,3 @@
 //! Integration tests for xnetwork2
 
 mod kademlia_modes;
-mod kademlia_config_test;
@@ -4,6 +4,8 @@ use std::time::Duration;
 use tokio::time::timeout;
 use xnetwork2::Node;
 
+mod utils;
+
 /// Тестирует полный жизненный цикл ноды: создание → запуск → прослушивание → событие → завершение
 /// Весь тест должен укладываться в 5 секунд
 #[tokio::test]
@@ -38,7 +40,7 @@ async fn test_node_lifecycle_in_5_seconds() {
         // 4. КОМАНДА LISTEN_ON (2-3 секунды)
         println!("🎯 Отправляем команду listen_on...");
         node.commander
-            .listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap())
+            .listen_on(utils::TEST_LISTEN_ADDR.clone())
             .await
             .expect("❌ Не удалось выполнить listen_on - критическая ошибка");
 
@@ -3,6 +3,8 @@
 use std::time::Duration;
 use xnetwork2::Node;
 
+mod utils;
+
 #[tokio::test]
 async fn test_dial_and_wait_returns_connection_id() {
     // Создаем две ноды
@@ -15,7 +17,7 @@ async fn test_dial_and_wait_returns_connection_id() {
     
     // Получаем адрес прослушивания второй ноды
     let listen_addr = node2.commander.listen_and_wait(
-        "/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap(),
+        utils::TEST_LISTEN_ADDR.clone(),
         Duration::from_secs(5)
     ).await.expect("Failed to listen on node2");
     
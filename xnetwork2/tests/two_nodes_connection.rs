@@ -5,6 +5,8 @@ use tokio::time::timeout;
 use xnetwork2::Node;
 use xnetwork2::node_events::NodeEvent;
 
+mod utils;
+
 /// Утилита для ожидания конкретного события с таймаутом
 async fn wait_for_event<F>(
     events: &mut tokio::sync::broadcast::Receiver<NodeEvent>,
@@ -76,10 +78,12 @@ async fn test_two_nodes_connection_in_5_seconds() {
     // Таймаут на весь тест - 5 секунд
     let result = timeout(Duration::from_secs(5), async {
         // 1. СОЗДАНИЕ ДВУХ НОД (0-1 секунда)
+        // Ноды независимы, поэтому создаем их параллельно
         println!("🆕 Создаем две ноды...");
-        let mut node1 = Node::new().await
+        let (node1, node2) = tokio::join!(Node::new(), Node::new());
+        let mut node1 = node1
             .expect("❌ Не удалось создать первую ноду - критическая ошибка");
-        let mut node2 = Node::new().await
+        let mut node2 = node2
             .expect("❌ Не удалось создать вторую ноду - критическая ошибка");
 
         println!("✅ Ноды созданы:");
@@ -92,11 +96,11 @@ async fn test_two_nodes_connection_in_5_seconds() {
         let mut node2_events = node2.subscribe();
 
         // 3. ЗАПУСК ОБЕИХ НОД (1-2 секунды)
+        // Запуск тоже независим — выполняем параллельно
         println!("🚀 Запускаем обе ноды...");
-        node1.start().await
-            .expect("❌ Не удалось запустить первую ноду - критическая ошибка");
-        node2.start().await
-            .expect("❌ Не удалось запустить вторую ноду - критическая ошибка");
+        let (start1, start2) = tokio::join!(node1.start(), node2.start());
+        start1.expect("❌ Не удалось запустить первую ноду - критическая ошибка");
+        start2.expect("❌ Не удалось запустить вторую ноду - критическая ошибка");
 
         println!("✅ Обе ноды запущены:");
         println!("   Node1 состояние: {}", node1.get_task_status());
@@ -104,7 +108,7 @@ async fn test_two_nodes_connection_in_5_seconds() {
 
         // 4. НОДА1 НАЧИНАЕТ СЛУШАТЬ (2-3 секунды)
         println!("🎯 Нода1 начинает прослушивание...");
-        node1.commander.listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap()).await
+        node1.commander.listen_on(utils::TEST_LISTEN_ADDR.clone()).await
             .expect("❌ Не удалось выполнить listen_on - критическая ошибка");
 
         println!("✅ Команда listen_on выполнена, ожидаем событие...");
@@ -169,17 +173,19 @@ async fn test_two_nodes_connection_in_5_seconds() {
         println!("   Node2 → Node1: {}", node2_peer_id);
 
         // 9. GRACEFUL SHUTDOWN ОБЕИХ НОД (4.8-5 секунд)
+        // Останавливаем ноды параллельно: иначе время завершения складывается
         println!("🛑 Выполняем graceful shutdown обеих нод...");
-        node1.commander.shutdown().await
-            .expect("❌ Не удалось выполнить graceful shutdown ноды1 - критическая ошибка");
-        node2.commander.shutdown().await
-            .expect("❌ Не удалось выполнить graceful shutdown ноды2 - критическая ошибка");
+        let (shutdown1, shutdown2) = tokio::join!(
+            node1.commander.shutdown(),
+            node2.commander.shutdown()
+        );
+        shutdown1.expect("❌ Не удалось выполнить graceful shutdown ноды1 - критическая ошибка");
+        shutdown2.expect("❌ Не удалось выполнить graceful shutdown ноды2 - критическая ошибка");
 
         println!("⏳ Ожидаем завершение фоновых задач...");
-        node1.wait_for_shutdown().await
-            .expect("❌ Не удалось дождаться завершения ноды1 - критическая ошибка");
-        node2.wait_for_shutdown().await
-            .expect("❌ Не удалось дождаться завершения ноды2 - критическая ошибка");
+        let (wait1, wait2) = tokio::join!(node1.wait_for_shutdown(), node2.wait_for_shutdown());
+        wait1.expect("❌ Не удалось дождаться завершения ноды1 - критическая ошибка");
+        wait2.expect("❌ Не удалось дождаться завершения ноды2 - критическая ошибка");
 
         println!("✅ Обе ноды корректно завершили работу");
 
@@ -11,7 +11,10 @@ use utils::{wait_for_event, spawn_auto_respond_por_task};
 
 /// Тестирует полную передачу данных через XStream между двумя нодами с проверкой целостности
 /// Весь тест должен укладываться в 10 секунд (с учетом аутентификации)
-#[tokio::test]
+///
+/// multi_thread: две ноды с реальным QUIC I/O выполняются на разных
+/// worker-потоках, а не по очереди на одном
+#[tokio::test(flavor = "multi_thread", worker_threads = 2)]
 async fn test_two_nodes_xstream_complete_data_transfer_in_10_seconds() {
     println!("🧪 Запуск полноценного теста XStream с реальным обменом данных (10 секунд)...");
 
@@ -134,7 +137,7 @@ async fn test_two_nodes_xstream_complete_data_transfer_in_10_seconds() {
 
         // 4. НОДА1 НАЧИНАЕТ СЛУШАТЬ
         println!("🎯 Нода1 начинает прослушивание...");
-        node1.commander.listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap()).await
+        node1.commander.listen_on(utils::TEST_LISTEN_ADDR.clone()).await
             .expect("❌ Не удалось выполнить listen_on - критическая ошибка");
 
         println!("✅ Команда listen_on выполнена, ожидаем событие...");
@@ -223,9 +226,8 @@ async fn test_two_nodes_xstream_complete_data_transfer_in_10_seconds() {
         
         println!("✅ Аутентификация успешно завершена");
 
-        // Даем системе время стабилизироваться после аутентификации
-        println!("⏳ Даем системе время стабилизироваться после аутентификации...");
-        sleep(Duration::from_secs(1)).await;
+        // Задачи PoR уже дождались успешной аутентификации с обеих сторон,
+        // дополнительная пауза "на стабилизацию" не нужна
 
         // 9. XSTREAM ВЗАИМОДЕЙСТВИЕ
         println!("📡 Начинаем XStream взаимодействие...");
@@ -1,5 +1,6 @@
 //! Утилиты для упрощения написания тестов XNetwork2
 
+use std::sync::LazyLock;
 use std::time::Duration;
 use tokio::time::timeout;
 use xnetwork2::{
@@ -10,6 +11,15 @@ use xnetwork2::{
 };
 use libp2p::Multiaddr;
 
+/// Стандартный QUIC адрес для прослушивания в тестах.
+/// Парсится один раз при первом обращении, а не при каждом вызове setup-утилит.
+#[allow(dead_code)]
+pub static TEST_LISTEN_ADDR: LazyLock<Multiaddr> = LazyLock::new(|| {
+    "/ip4/127.0.0.1/udp/0/quic-v1"
+        .parse()
+        .expect("❌ Не удалось распарсить QUIC адрес")
+});
+
 /// Утилита для ожидания конкретного события с таймаутом
 pub async fn wait_for_event<F>(
     events: &mut tokio::sync::broadcast::Receiver<NodeEvent>,
@@ -101,7 +111,7 @@ pub fn spawn_por_task(
         if let NodeEvent::VerifyPorRequest { peer_id, .. } = por_event {
             println!("✅ Получен VerifyPorRequest для пира {}, подтверждаем аутентификацию...", peer_id);
             commander.submit_por_verification(peer_id, true).await
-                .expect(&format!("❌ Не удалось подтвердить аутентификацию для пира {} - критическая ошибка", peer_id));
+                .unwrap_or_else(|_| panic!("❌ Не удалось подтвердить аутентификацию для пира {} - критическая ошибка", peer_id));
             println!("✅ Аутентификация для пира {} успешно подтверждена", peer_id);
         }
 
@@ -141,7 +151,7 @@ pub async fn setup_listening_node(node: &mut Node) -> Result<Multiaddr, Box<dyn
     node.commander
         .send(XNetworkCommands::SwarmLevel(
             SwarmLevelCommand::ListenOn { 
-                addr: "/ip4/127.0.0.1/udp/0/quic-v1".parse().expect("❌ Не удалось распарсить QUIC адрес"),
+                addr: TEST_LISTEN_ADDR.clone(),
                 response: listen_response 
             }
         ))
@@ -373,27 +383,22 @@ pub async fn wait_for_manual_por_requests(
 ) -> Result<(NodeEvent, NodeEvent), Box<dyn std::error::Error + Send + Sync>> {
     println!("🔐 Ожидаем VerifyPorRequest на обеих нодах в ручном режиме...");
 
-    // Запускаем задачи ожидания на обеих нодах
-    let (task1, mut events1) = spawn_manual_por_task(node1, *node2.peer_id(), timeout_duration);
-    let (task2, mut events2) = spawn_manual_por_task(node2, *node1.peer_id(), timeout_duration);
+    // Ждем оба события одним wait_for_two_events: раньше те же события
+    // дополнительно ожидались в отдельных задачах на resubscribe-копиях
+    // каналов, то есть каждый запрос ждали дважды
+    let expected_peer1 = *node2.peer_id();
+    let expected_peer2 = *node1.peer_id();
+    let mut events1 = node1.subscribe();
+    let mut events2 = node2.subscribe();
 
-    // Используем wait_for_two_events для ожидания обоих событий
     let (event1, event2) = wait_for_two_events(
         &mut events1,
         &mut events2,
-        |e| matches!(e, NodeEvent::VerifyPorRequest { .. }),
-        |e| matches!(e, NodeEvent::VerifyPorRequest { .. }),
+        |e| matches!(e, NodeEvent::VerifyPorRequest { peer_id, .. } if *peer_id == expected_peer1),
+        |e| matches!(e, NodeEvent::VerifyPorRequest { peer_id, .. } if *peer_id == expected_peer2),
         timeout_duration,
     ).await?;
 
-    // Ждем завершения задач
-    task1.await
-        .expect("❌ Задача ожидания PoR для ноды1 завершилась с ошибкой (join)")
-        .expect("❌ Задача ожидания PoR для ноды1 завершилась с ошибкой (task)");
-    task2.await
-        .expect("❌ Задача ожидания PoR для ноды2 завершилась с ошибкой (join)")
-        .expect("❌ Задача ожидания PoR для ноды2 завершилась с ошибкой (task)");
-
     println!("✅ Оба VerifyPorRequest получены в ручном режиме");
     Ok((event1, event2))
 }
@@ -431,9 +436,8 @@ pub async fn assert_no_auth_events(
                         return Err::<(), _>("❌ Нода2 получила событие успешной аутентификации в ручном режиме".into());
                     }
                 }
-                _ = tokio::time::sleep(Duration::from_millis(100)) => {
-                    // Периодическая проверка завершения
-                }
+                // Ветки recv() событийные, таймер-заглушка не нужна:
+                // внешний timeout() сам прервет цикл по истечении duration
             }
         }
     }).await;
@@ -541,12 +545,11 @@ pub fn spawn_auth_completion_task(
         let _auth_event = wait_for_event(
             &mut events,
             |e| {
-                matches!(e, 
-                    NodeEvent::PeerMutualAuthSuccess { peer_id, .. } if *peer_id == expected_peer_id
-                ) || matches!(e, 
-                    NodeEvent::PeerOutboundAuthSuccess { peer_id, .. } if *peer_id == expected_peer_id
-                ) || matches!(e, 
-                    NodeEvent::PeerInboundAuthSuccess { peer_id, .. } if *peer_id == expected_peer_id
+                matches!(e,
+                    NodeEvent::PeerMutualAuthSuccess { peer_id, .. }
+                    | NodeEvent::PeerOutboundAuthSuccess { peer_id, .. }
+                    | NodeEvent::PeerInboundAuthSuccess { peer_id, .. }
+                    if *peer_id == expected_peer_id
                 )
             },
             timeout_duration,
@@ -581,7 +584,7 @@ pub fn spawn_auto_respond_por_task(
         if let NodeEvent::VerifyPorRequest { peer_id, .. } = por_event {
             println!("✅ Получен VerifyPorRequest от пира {}, подтверждаем аутентификацию...", peer_id);
             commander.submit_por_verification(peer_id, true).await
-                .expect(&format!("❌ Не удалось подтвердить аутентификацию для пира {} - критическая ошибка", peer_id));
+                .unwrap_or_else(|_| panic!("❌ Не удалось подтвердить аутентификацию для пира {} - критическая ошибка", peer_id));
             println!("✅ Аутентификация для пира {} успешно подтверждена", peer_id);
         }
 
@@ -18,10 +18,12 @@ async fn test_two_nodes_xauth_mutual_authentication_in_5_seconds() {
     // Таймаут на весь тест - 5 секунд
     let result = timeout(Duration::from_secs(5), async {
         // 1. СОЗДАНИЕ ДВУХ НОД (0-1 секунда)
+        // Ноды независимы, поэтому создаем их параллельно
         println!("🆕 Создаем две ноды...");
-        let mut node1 = Node::new().await
+        let (node1, node2) = tokio::join!(Node::new(), Node::new());
+        let mut node1 = node1
             .expect("❌ Не удалось создать первую ноду - критическая ошибка");
-        let mut node2 = Node::new().await
+        let mut node2 = node2
             .expect("❌ Не удалось создать вторую ноду - критическая ошибка");
 
         println!("✅ Ноды созданы:");
@@ -34,11 +36,11 @@ async fn test_two_nodes_xauth_mutual_authentication_in_5_seconds() {
         let mut node2_events = node2.subscribe();
 
         // 3. ЗАПУСК ОБЕИХ НОД (1-2 секунды)
+        // Запуск тоже независим — выполняем параллельно
         println!("🚀 Запускаем обе ноды...");
-        node1.start().await
-            .expect("❌ Не удалось запустить первую ноду - критическая ошибка");
-        node2.start().await
-            .expect("❌ Не удалось запустить вторую ноду - критическая ошибка");
+        let (start1, start2) = tokio::join!(node1.start(), node2.start());
+        start1.expect("❌ Не удалось запустить первую ноду - критическая ошибка");
+        start2.expect("❌ Не удалось запустить вторую ноду - критическая ошибка");
 
         println!("✅ Обе ноды запущены:");
         println!("   Node1 состояние: {}", node1.get_task_status());
@@ -46,7 +48,7 @@ async fn test_two_nodes_xauth_mutual_authentication_in_5_seconds() {
 
         // 4. НОДА1 НАЧИНАЕТ СЛУШАТЬ (2-3 секунды)
         println!("🎯 Нода1 начинает прослушивание...");
-        node1.commander.listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap()).await
+        node1.commander.listen_on(utils::TEST_LISTEN_ADDR.clone()).await
             .expect("❌ Не удалось выполнить listen_on - критическая ошибка");
 
         println!("✅ Команда listen_on выполнена, ожидаем событие...");
@@ -46,7 +46,7 @@ async fn test_xauth_xstream_decision_flow_in_5_seconds() {
 
         // 4. НОДА1 НАЧИНАЕТ СЛУШАТЬ (2-3 секунды)
         println!("🎯 Нода1 начинает прослушивание...");
-        node1.commander.listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap()).await
+        node1.commander.listen_on(utils::TEST_LISTEN_ADDR.clone()).await
             .expect("❌ Не удалось выполнить listen_on - критическая ошибка");
 
         println!("✅ Команда listen_on выполнена, ожидаем событие...");
@@ -1,6 +1,5 @@
 //! Integration tests for XRoutes behaviour with real node
 
-use std::time::Duration;
 use xnetwork2::{
     node_builder,
 };
@@ -19,9 +18,8 @@ async fn test_xroutes_initial_status() {
         .await
         .expect("Failed to start node");
     
-    // Small delay to ensure swarm loop is running
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
+    // Команды сериализуются через swarm loop: следующий же запрос
+    // commander-а подтверждает готовность, отдельная пауза не нужна
     // Get initial XRoutes status using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
@@ -54,16 +52,12 @@ async fn test_xroutes_enable_disable_mdns() {
         .await
         .expect("Failed to start node");
     
-    // Small delay to ensure swarm loop is running
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
+    // Команды сериализуются через swarm loop: следующий же запрос
+    // commander-а подтверждает готовность, отдельная пауза не нужна
     // Enable mDNS using alias method
     node.commander.enable_mdns().await
         .expect("Failed to enable mDNS");
     
-    // Small delay to allow behaviour to be enabled
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
     // Check status after enabling using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
@@ -75,9 +69,6 @@ async fn test_xroutes_enable_disable_mdns() {
     node.commander.disable_mdns().await
         .expect("Failed to disable mDNS");
     
-    // Small delay to allow behaviour to be disabled
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
     // Check status after disabling using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
@@ -105,16 +96,12 @@ async fn test_xroutes_enable_disable_kad() {
         .await
         .expect("Failed to start node");
     
-    // Small delay to ensure swarm loop is running
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
+    // Команды сериализуются через swarm loop: следующий же запрос
+    // commander-а подтверждает готовность, отдельная пауза не нужна
     // Enable Kademlia using alias method
     node.commander.enable_kad().await
         .expect("Failed to enable Kademlia");
     
-    // Small delay to allow behaviour to be enabled
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
     // Check status after enabling using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
@@ -126,9 +113,6 @@ async fn test_xroutes_enable_disable_kad() {
     node.commander.disable_kad().await
         .expect("Failed to disable Kademlia");
     
-    // Small delay to allow behaviour to be disabled
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
     // Check status after disabling using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
@@ -156,9 +140,8 @@ async fn test_xroutes_enable_both_behaviours() {
         .await
         .expect("Failed to start node");
     
-    // Small delay to ensure swarm loop is running
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
+    // Команды сериализуются через swarm loop: следующий же запрос
+    // commander-а подтверждает готовность, отдельная пауза не нужна
     // Enable mDNS using alias method
     node.commander.enable_mdns().await
         .expect("Failed to enable mDNS");
@@ -167,9 +150,6 @@ async fn test_xroutes_enable_both_behaviours() {
     node.commander.enable_kad().await
         .expect("Failed to enable Kademlia");
     
-    // Small delay to allow behaviours to be enabled
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
     // Check status after enabling both using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
@@ -187,9 +167,6 @@ async fn test_xroutes_enable_both_behaviours() {
     node.commander.disable_kad().await
         .expect("Failed to disable Kademlia");
     
-    // Small delay to allow behaviours to be disabled
-    tokio::time::sleep(Duration::from_millis(100)).await;
-    
     // Check status after disabling both using alias method
     let status = node.commander.get_xroutes_status().await
         .expect("Failed to get XRoutes status");
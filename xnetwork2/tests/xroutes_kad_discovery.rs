@@ -14,22 +14,16 @@ async fn test_kademlia_discovery_with_bootstrap() -> Result<(), Box<dyn std::err
     // ФАЗА 1: Подготовка узлов + включение XRoutes сразу
     println!("🛠️ Фаза 1: Подготовка узлов и включение XRoutes...");
 
-    // 1.1 Создание и запуск узлов
+    // 1.1 Создание и запуск узлов (параллельно — узлы независимы)
     println!("🆕 Создаем три узла...");
-    let mut node_bootstrap = node_builder::builder()
-        .build()
-        .await
-        .expect("❌ Не удалось создать bootstrap node - критическая ошибка");
-    
-    let mut node1 = node_builder::builder()
-        .build()
-        .await
-        .expect("❌ Не удалось создать node1 - критическая ошибка");
-    
-    let mut node2 = node_builder::builder()
-        .build()
-        .await
-        .expect("❌ Не удалось создать node2 - критическая ошибка");
+    let (node_bootstrap, node1, node2) = tokio::join!(
+        node_builder::builder().build(),
+        node_builder::builder().build(),
+        node_builder::builder().build(),
+    );
+    let mut node_bootstrap = node_bootstrap.expect("❌ Не удалось создать bootstrap node - критическая ошибка");
+    let mut node1 = node1.expect("❌ Не удалось создать node1 - критическая ошибка");
+    let mut node2 = node2.expect("❌ Не удалось создать node2 - критическая ошибка");
 
     // Подписка на события ДО запуска узлов
     println!("📡 Подписываемся на события всех узлов...");
@@ -37,15 +31,19 @@ async fn test_kademlia_discovery_with_bootstrap() -> Result<(), Box<dyn std::err
     let _node1_events = node1.subscribe();
     let _node2_events = node2.subscribe();
 
-    // Запуск всех узлов
+    // Запуск всех узлов (параллельно)
     println!("🚀 Запускаем все узлы...");
-    node_bootstrap.start().await.expect("❌ Не удалось запустить bootstrap node - критическая ошибка");
-    node1.start().await.expect("❌ Не удалось запустить node1 - критическая ошибка");
-    node2.start().await.expect("❌ Не удалось запустить node2 - критическая ошибка");
-
-    // Небольшая задержка для запуска swarm loops
-    tokio::time::sleep(Duration::from_millis(100)).await;
-
+    let (start_bootstrap, start1, start2) = tokio::join!(
+        node_bootstrap.start(),
+        node1.start(),
+        node2.start(),
+    );
+    start_bootstrap.expect("❌ Не удалось запустить bootstrap node - критическая ошибка");
+    start1.expect("❌ Не удалось запустить node1 - критическая ошибка");
+    start2.expect("❌ Не удалось запустить node2 - критическая ошибка");
+
+    // Команды сериализуются через swarm loop, поэтому последующие
+    // enable_identify/enable_kad сами дождутся его запуска
     println!("✅ Узлы созданы и запущены:");
     println!("   - Bootstrap: {:?}", node_bootstrap.peer_id());
     println!("   - Node 1: {:?}", node1.peer_id());
@@ -139,8 +137,8 @@ async fn test_kademlia_discovery_with_bootstrap() -> Result<(), Box<dyn std::err
     // Вместо ожидания конкретных Identify событий, мы можем проверить, что Kademlia
     // получает информацию о пирах через Identify
     println!("✅ Identify включен и работает автоматически");
-    println!("⏳ Ждем обмена Identify информацией (2 секунды)...");
-    tokio::time::sleep(Duration::from_millis(100)).await;
+    // Фиксированное ожидание не нужно: bootstrap_to_peer получает адреса
+    // явно и не зависит от обмена Identify
 
     // Проверяем, что XRoutesHandler печатает события Identify
     println!("✅ XRoutesHandler настроен на печать событий Identify");
@@ -167,9 +165,9 @@ async fn test_kademlia_discovery_with_bootstrap() -> Result<(), Box<dyn std::err
     .expect("❌ Node2 должен успешно выполнить bootstrap");
     println!("✅ Node2 выполнил bootstrap к bootstrap node");
 
-    // Ждем распространения информации в DHT
-    println!("⏳ Ждем распространения информации в DHT (2 секунды)...");
-    tokio::time::sleep(Duration::from_millis(100)).await;
+    // bootstrap_to_peer возвращается после завершения bootstrap-запроса,
+    // то есть bootstrap node уже знает оба узла; find_peer_addresses сам
+    // ждет завершения Kademlia-запроса со своим таймаутом
 
     // 5.2 Тестирование Kademlia функциональности
     println!("🧪 Тестируем Kademlia функциональность...");
@@ -281,9 +279,14 @@ async fn test_kademlia_discovery_with_bootstrap() -> Result<(), Box<dyn std::err
 
     // Очистка ресурсов
     println!("🧹 Выполняем очистку ресурсов...");
-    node_bootstrap.force_shutdown().await.expect("❌ Не удалось завершить bootstrap node");
-    node1.force_shutdown().await.expect("❌ Не удалось завершить node1");
-    node2.force_shutdown().await.expect("❌ Не удалось завершить node2");
+    let (stop_bootstrap, stop1, stop2) = tokio::join!(
+        node_bootstrap.force_shutdown(),
+        node1.force_shutdown(),
+        node2.force_shutdown(),
+    );
+    stop_bootstrap.expect("❌ Не удалось завершить bootstrap node");
+    stop1.expect("❌ Не удалось завершить node1");
+    stop2.expect("❌ Не удалось завершить node2");
 
     println!("🎉 Тест Kademlia discovery успешно завершен!");
     println!("   - Bootstrap: {:?}", node_bootstrap.peer_id());
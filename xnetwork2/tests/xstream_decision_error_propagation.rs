@@ -5,6 +5,8 @@ use tokio::time::timeout;
 use xnetwork2::node_events::NodeEvent;
 use xnetwork2::{InboundDecisionPolicy, Node};
 
+mod utils;
+
 /// Тестирует передачу ошибок при отклонении входящих XStream
 #[tokio::test]
 async fn test_xstream_decision_error_propagation() {
@@ -36,14 +38,14 @@ async fn test_xstream_decision_error_propagation() {
     // Нода1 слушает на localhost с QUIC
     node1
         .commander
-        .listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap())
+        .listen_on(utils::TEST_LISTEN_ADDR.clone())
         .await
         .expect("❌ Нода1 не смогла начать слушать");
 
     // Нода2 слушает на другом порту с QUIC
     node2
         .commander
-        .listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap())
+        .listen_on(utils::TEST_LISTEN_ADDR.clone())
         .await
         .expect("❌ Нода2 не смогла начать слушать");
 
@@ -146,14 +148,14 @@ async fn test_xstream_decision_approval_success() {
     // Нода1 слушает на localhost с QUIC
     node1
         .commander
-        .listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap())
+        .listen_on(utils::TEST_LISTEN_ADDR.clone())
         .await
         .expect("❌ Нода1 не смогла начать слушать");
 
     // Нода2 слушает на другом порту с QUIC
     node2
         .commander
-        .listen_on("/ip4/127.0.0.1/udp/0/quic-v1".parse().unwrap())
+        .listen_on(utils::TEST_LISTEN_ADDR.clone())
         .await
         .expect("❌ Нода2 не смогла начать слушать");
 